@@ -13,5 +13,8 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from ._client import GfyCatClient, ImgurClient, StreamableClient, StreamffClient, \
-    StreamjaClient, VHPClient  # noqa: F401
+from ._async_client import AsyncGfyCatClient, AsyncImgurClient, AsyncRetryTransport, \
+    AsyncStreamableClient, AsyncStreamffClient, AsyncStreamjaClient, \
+    AsyncVHPClient  # noqa: F401
+from ._client import GfyCatClient, ImgurClient, ImgurTicketPoller, RetryTransport, \
+    StreamableClient, StreamffClient, StreamjaClient, VHPClient  # noqa: F401
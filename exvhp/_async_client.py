@@ -0,0 +1,855 @@
+# pyeXVHP - Python Interface for Video Hosting Platforms
+# Copyright © 2023 - eXhumer
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, version 3 of the License.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from asyncio import TaskGroup, create_task, get_running_loop, sleep
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from hashlib import file_digest
+from io import BytesIO, SEEK_END, SEEK_SET
+from os import fstat
+from pathlib import Path
+from random import uniform
+from typing import BinaryIO, Dict, Literal
+from urllib.parse import urlparse
+
+from functools import cached_property
+
+from httpx import AsyncClient, AsyncHTTPTransport, HTTPError, Limits, Request, TransportError
+
+from ._client import __user_agent__, _aws_authorization, _dump_json, _guess_type, \
+    _load_json, _PageCache, _raise_on_error, _replayable, _retry_delay, h2_available
+from ._html import OG_VIDEO_RE, SOURCE_SRC_RE, search_string
+from .type import (
+    GfyCatCreatePost,
+    GfyCatNewPost,
+    GfyCatPostInfo,
+    GfyCatUploadStatus,
+    GfyCatWebToken,
+    ImgurAddMediaToAlbumResponse,
+    ImgurCheckCaptchaResponse,
+    ImgurGenerateAlbumResponse,
+    ImgurMedia,
+    ImgurUpdateMediaResponse,
+    ImgurUploadedImageResponse,
+    ImgurUploadPollResponse,
+    ImgurUploadTicketResponse,
+    StreamableUploadData,
+    StreamableVideoData,
+    StreamableVideoExtractorData,
+    StreamjaUploadUrlData,
+    StreamjaUploadData,
+    StreamffVideoData,
+)
+
+
+async def _json_request(client: AsyncClient, method: str, url: str, payload, *,
+                        params: dict | None = None, headers: dict | None = None):
+    if payload is None:
+        res = await client.request(method, url, params=params, headers=headers)
+
+    else:
+        res = await client.request(method, url, content=_dump_json(payload), params=params,
+                                   headers={"Content-Type": "application/json"} |
+                                   (headers or {}))
+
+    _raise_on_error(res)
+
+    return res
+
+
+async def _multipart_upload(client: AsyncClient, url: str, files: dict, *,
+                            data: dict | None = None, params: dict | None = None,
+                            headers: dict | None = None):
+    res = await client.post(url, data=data, files=files, params=params, headers=headers)
+
+    _raise_on_error(res)
+
+    return res
+
+
+async def _aiter_blocks(source: BinaryIO, block_size: int = 1 << 22):
+    loop = get_running_loop()
+
+    while block := await loop.run_in_executor(None, source.read, block_size):
+        yield block
+
+
+class AsyncRetryTransport(AsyncHTTPTransport):
+    """Async HTTP transport retrying transient failures with exponential backoff.
+
+    Connection errors and 429/5xx responses are retried up to MAX_RETRIES
+    attempts with full-jitter backoff, honouring Retry-After when the server
+    sends one. Requests whose body stream cannot be replayed are never
+    retried."""
+    MAX_BACKOFF = 30.0
+    MAX_RETRIES = 5
+    RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+    async def handle_async_request(self, request: Request):
+        for attempt in range(self.MAX_RETRIES - 1):
+            try:
+                res = await super().handle_async_request(request)
+
+            except TransportError:
+                if not _replayable(request):
+                    raise
+
+                retry_after = None
+
+            else:
+                if res.status_code not in self.RETRY_STATUSES or not _replayable(request):
+                    return res
+
+                retry_after = res.headers.get("Retry-After")
+                await res.aclose()
+
+            await sleep(_retry_delay(attempt, self.MAX_BACKOFF, retry_after))
+
+        return await super().handle_async_request(request)
+
+
+class AsyncGfyCatClient:
+    API_URL = "https://api.gfycat.com"
+    WEBLOGIN_URL = "https://weblogin.gfycat.com"
+    WEBTOKEN_ACCESS_KEY = "Anr96uuqt9EdamSCwK4txKPjMsf2M95Rfa5FLLhPFucu8H5HTzeutyAa"
+    GFYCATS_URL = API_URL + "/v1/gfycats"
+    GFYCAT_URL = API_URL + "/v1/gfycats/{}"
+    GFYCAT_STATUS_URL = API_URL + "/v1/gfycats/fetch/status/{}"
+    WEBTOKEN_URL = WEBLOGIN_URL + "/oauth/webtoken"
+    __TOKEN_CACHE: dict[str, tuple[str, datetime]] = {}
+
+    def __init__(self, client: AsyncClient, user_agent: str | None = None):
+        self.__auth_headers = None
+        self.__authorization = None
+        self.__client = client
+        self.__expires_at = None
+        self.__user_agent = user_agent
+
+    def __apply_token(self, authorization: str, expires_at: datetime):
+        self.__authorization = authorization
+        self.__expires_at = expires_at
+        self.__auth_headers = {"Authorization": authorization,
+                               "User-Agent": self.__user_agent or __user_agent__}
+
+    async def __obtain_authorization(self):
+        cached = AsyncGfyCatClient.__TOKEN_CACHE.get(self.WEBTOKEN_ACCESS_KEY)
+
+        if cached is not None and datetime.now(tz=timezone.utc) < cached[1]:
+            self.__apply_token(*cached)
+            return
+
+        res = await _json_request(self.__client, "POST", self.WEBTOKEN_URL,
+                                  {"access_key": self.WEBTOKEN_ACCESS_KEY},
+                                  headers={"User-Agent":
+                                           self.__user_agent or __user_agent__})
+
+        token_data: GfyCatWebToken = _load_json(res)
+        access_token = token_data["access_token"]
+        token_type = token_data["token_type"]
+        expires_in = token_data["expires_in"]
+
+        expires_at = parsedate_to_datetime(res.headers["Date"]) + timedelta(seconds=expires_in)
+        self.__apply_token(f"{token_type} {access_token}", expires_at)
+        AsyncGfyCatClient.__TOKEN_CACHE[self.WEBTOKEN_ACCESS_KEY] = (self.__authorization,
+                                                                     expires_at)
+
+    async def __ensure_authorization(self):
+        if self.__expires_at is None or datetime.now(tz=timezone.utc) >= self.__expires_at:
+            await self.__obtain_authorization()
+
+    async def delete_post(self, gfyname: str):
+        await self.__ensure_authorization()
+
+        res = await self.__client.delete(self.GFYCAT_URL.format(gfyname),
+                                         headers=self.__auth_headers)
+
+        _raise_on_error(res)
+
+        return res.status_code < 400
+
+    async def get_post_info(self, gfyid: str):
+        await self.__ensure_authorization()
+
+        res = await self.__client.get(self.GFYCAT_URL.format(gfyid),
+                                      headers=self.__auth_headers)
+
+        _raise_on_error(res)
+
+        post_info: GfyCatPostInfo = _load_json(res)
+
+        return post_info
+
+    async def get_upload_status(self, gfyid: str):
+        await self.__ensure_authorization()
+
+        res = await self.__client.get(self.GFYCAT_STATUS_URL.format(gfyid),
+                                      headers=self.__auth_headers)
+
+        _raise_on_error(res)
+
+        post_status: GfyCatUploadStatus = _load_json(res)
+
+        return post_status
+
+    async def new_video_post(self, post_data: GfyCatCreatePost | None = None):
+        await self.__ensure_authorization()
+
+        res = await _json_request(self.__client, "POST", self.GFYCATS_URL, post_data,
+                                  headers=self.__auth_headers)
+
+        new_post_data: GfyCatNewPost = _load_json(res)
+
+        return new_post_data
+
+    async def upload_video(self, gfyname: str, media_io: BinaryIO, filename: str = "video.mp4",
+                           upload_type: str = "filedrop.gfycat.com"):
+        res = await _multipart_upload(self.__client, f"https://{upload_type}/",
+                                      {"file": (filename, media_io, _guess_type(filename))},
+                                      data={"key": gfyname},
+                                      headers={"User-Agent":
+                                               self.__user_agent or __user_agent__})
+
+        return res.status_code < 400
+
+
+class AsyncImgurClient:
+    api_url = "https://api.imgur.com"
+    base_url = "https://imgur.com"
+    client_id = "546c25a59c58ad7"
+    album_add_url = api_url + "/3/album/{}/add"
+    album_medias_url = api_url + "/post/v1/albums/{}"
+    album_url = api_url + "/3/album/{}"
+    albums_url = api_url + "/3/album"
+    checkcaptcha_url = api_url + "/3/upload/checkcaptcha"
+    image_url = api_url + "/3/image/{}"
+    images_url = api_url + "/3/image"
+    media_url = api_url + "/post/v1/media/{}"
+    upload_poll_url = base_url + "/upload/poll"
+
+    def __init__(self, client: AsyncClient | None = None, user_agent: str | None = None):
+        client = client or AsyncClient(http2=h2_available)
+        client.headers["User-Agent"] = user_agent or __user_agent__
+        self.__client = client
+        self.__media_params = {"client_id": self.client_id, "include": "media"}
+        self.__params = {"client_id": self.client_id}
+
+    async def add_media_to_album(self, album_deletehash: str, *media_deletehashes: str):
+        res = await _json_request(self.__client, "POST",
+                                  self.album_add_url.format(album_deletehash),
+                                  {"deletehashes": list(media_deletehashes)},
+                                  params=self.__params)
+
+        data: ImgurAddMediaToAlbumResponse = _load_json(res)
+
+        return data
+
+    async def check_captcha(self, total_upload: int, g_recaptcha_response: str | None = None):
+        res = await _json_request(self.__client, "POST", self.checkcaptcha_url,
+                                  {
+                                      "g-recaptcha-response": g_recaptcha_response,
+                                      "total_upload": total_upload,
+                                  },
+                                  params=self.__params)
+
+        data: ImgurCheckCaptchaResponse = _load_json(res)
+
+        return data
+
+    async def generate_album(self, *media_deletehashes: str, title: str | None = None,
+                             description: str | None = None, cover: str | None = None):
+        album_data = {}
+
+        if len(media_deletehashes) > 0:
+            album_data["deletehashes"] = list(media_deletehashes)
+
+        if title:
+            album_data["title"] = title
+
+        if description:
+            album_data["description"] = description
+
+        if cover:
+            album_data["cover"] = cover
+
+        res = await _json_request(self.__client, "POST", self.albums_url, album_data,
+                                  params=self.__params)
+
+        data: ImgurGenerateAlbumResponse = _load_json(res)
+
+        return data
+
+    async def get_album_medias(self, album_id: str):
+        res = await self.__client.get(self.album_medias_url.format(album_id),
+                                      params=self.__media_params)
+
+        _raise_on_error(res)
+
+        data: ImgurMedia = _load_json(res)
+
+        return data
+
+    async def get_media(self, media_id: str):
+        res = await self.__client.get(self.media_url.format(media_id),
+                                      params=self.__media_params)
+
+        _raise_on_error(res)
+
+        data: ImgurMedia = _load_json(res)
+
+        return data
+
+    async def poll_video_tickets(self, *tickets: str):
+        res = await self.__client.get(self.upload_poll_url,
+                                      params=self.__params | {"tickets[]": list(tickets)})
+
+        _raise_on_error(res)
+
+        poll_data: ImgurUploadPollResponse = _load_json(res)
+
+        return poll_data
+
+    async def wait_for_tickets(self, *tickets: str, initial: float = 1.0,
+                               max_interval: float = 10.0, factor: float = 2.0,
+                               max_attempts: int = 60):
+        pending = set(tickets)
+        done: dict[str, str] = {}
+        attempt = 0
+        interval = min(max_interval, initial)
+
+        while pending and attempt < max_attempts:
+            poll_data = await self.poll_video_tickets(*sorted(pending))
+            done |= poll_data["data"]["done"]
+            pending.difference_update(done)
+
+            if not pending:
+                break
+
+            await sleep(uniform(0, interval))
+            interval = min(max_interval, interval * factor)
+            attempt += 1
+
+        return done
+
+    async def update_album(self, album_deletehash: str, title: str | None = None,
+                           description: str | None = None, cover_id: str | None = None,
+                           *media_deletehashes: str):
+        album_data = {}
+
+        if cover_id:
+            album_data["cover"] = cover_id
+
+        if title:
+            album_data["title"] = title
+
+        if description:
+            album_data["description"] = description
+
+        if len(media_deletehashes) > 0:
+            album_data["deletehashes"] = list(media_deletehashes)
+
+        res = await _json_request(self.__client, "PUT",
+                                  self.album_url.format(album_deletehash), album_data,
+                                  params=self.__params)
+
+        data: ImgurUpdateMediaResponse = _load_json(res)
+
+        return data
+
+    async def update_media(self, media_deletehash: str, title: str | None = None,
+                           description: str | None = None):
+        media_data = {}
+
+        if title:
+            media_data["title"] = title
+
+        if description:
+            media_data["description"] = description
+
+        res = await _json_request(self.__client, "PUT",
+                                  self.image_url.format(media_deletehash), media_data,
+                                  params=self.__params)
+
+        data: ImgurUpdateMediaResponse = _load_json(res)
+
+        return data
+
+    async def upload_media(self, media_io: BinaryIO, media_filename: str,
+                           media_mimetype: str | None = None):
+        if not media_mimetype:
+            media_mimetype = _guess_type(media_filename)
+
+        assert media_mimetype is not None, "Unable to guess media MIME type!"
+        assert media_mimetype.startswith(("image/", "video/"))
+
+        media_name = "image" if media_mimetype.startswith("image/") else "video"
+        files = {media_name: (media_filename, media_io, media_mimetype)}
+
+        res = await _multipart_upload(self.__client, self.images_url, files,
+                                      params=self.__params)
+
+        data: ImgurUploadedImageResponse | ImgurUploadTicketResponse = _load_json(res)
+
+        return data
+
+
+class AsyncStreamableClient:
+    API_URL = "https://ajax.streamable.com"
+    BASE_URL = "https://streamable.com"
+    FRONTEND_REACT_VERSION = "5a6120a04b6db864113d706cc6a6131cb8ca3587"
+    EXTRACT_URL = API_URL + "/extract"
+    PAGE_CACHE_SIZE = 128
+    PAGE_CACHE_TTL = 5.0
+    PLAYER_MARKER = b'id="player-content"'
+    SHORTCODE_URL = API_URL + "/shortcode"
+    TRANSCODE_URL = API_URL + "/transcode/{}"
+    VIDEO_PAGE_URL = BASE_URL + "/{}"
+    VIDEO_URL = API_URL + "/videos/{}"
+    VIDEOS_URL = API_URL + "/videos"
+
+    def __init__(self, client: AsyncClient, user_agent: str | None = None):
+        self.__client = client
+        self.__page_cache = _PageCache(self.PAGE_CACHE_SIZE, self.PAGE_CACHE_TTL)
+        self.__user_agent = user_agent or __user_agent__
+
+    async def __fetch_video_page(self, video_id: str):
+        res = self.__page_cache.get(video_id)
+
+        if res is not None:
+            return res
+
+        res = await self.__client.get(AsyncStreamableClient.VIDEO_PAGE_URL.format(video_id),
+                                      headers={"User-Agent": self.__user_agent})
+
+        if res.status_code < 400:
+            self.__page_cache.put(video_id, res)
+
+        return res
+
+    async def __generate_clip_shortcode(self, video_id: str, video_source: str,
+                                        title: str | None = None):
+        res = await _json_request(self.__client, "POST", self.VIDEOS_URL,
+                                  {
+                                      "extract_id": video_id,
+                                      "extractor": (
+                                        "streamable"
+                                        if video_source.startswith("https://streamable.com")
+                                        else "generic"
+                                      ),
+                                      "source": video_source,
+                                      "status": 1,
+                                      "title": title,
+                                      "upload_source": "clip",
+                                  },
+                                  headers={"User-Agent": self.__user_agent})
+
+        res_json: StreamableVideoData = _load_json(res)
+
+        return res_json
+
+    async def __generate_upload_shortcode(self, video_sz: int):
+        res = await self.__client.get(self.SHORTCODE_URL,
+                                      headers={"User-Agent": self.__user_agent},
+                                      params={
+                                          "version": self.FRONTEND_REACT_VERSION,
+                                          "size": video_sz,
+                                      })
+
+        _raise_on_error(res)
+
+        res_json: StreamableUploadData = _load_json(res)
+
+        return res_json
+
+    async def __transcode_clipped_video(self, shortcode: str, video_headers: Dict[str, str],
+                                        video_url: str,
+                                        extractor: Literal["streamable", "generic"] = "generic",
+                                        mute: bool = False, title: str | None = None):
+        res = await _json_request(self.__client, "POST", self.TRANSCODE_URL.format(shortcode),
+                                  {
+                                      "extractor": extractor,
+                                      "headers": video_headers,
+                                      "mute": mute,
+                                      "shortcode": shortcode,
+                                      "thumb_offset": None,
+                                      "title": title,
+                                      "upload_source": "clip",
+                                      "url": video_url,
+                                  },
+                                  headers={"User-Agent": self.__user_agent})
+
+        res_json: StreamableVideoData = _load_json(res)
+
+        return res_json
+
+    async def __transcode_uploaded_video(self, shortcode: str, url: str, transcoder_token: str,
+                                         video_sz: int):
+        res = await _json_request(self.__client, "POST", self.TRANSCODE_URL.format(shortcode),
+                                  {
+                                      "shortcode": shortcode,
+                                      "size": video_sz,
+                                      "token": transcoder_token,
+                                      "upload_source": "web",
+                                      "url": url,
+                                  })
+
+        res_json: StreamableVideoData = _load_json(res)
+
+        return res_json
+
+    async def __warm_upload_connection(self, host: str):
+        try:
+            await self.__client.head(f"https://{host}/",
+                                     headers={"User-Agent": self.__user_agent})
+
+        except HTTPError:
+            pass
+
+    async def __update_upload_metadata(self, shortcode: str, filename: str, video_sz: int,
+                                       title: str | None = None):
+        res = await _json_request(self.__client, "PUT", self.VIDEO_URL.format(shortcode),
+                                  {
+                                      "original_name": filename,
+                                      "original_size": video_sz,
+                                      "title": title or Path(filename).stem,
+                                      "upload_source": "web",
+                                  },
+                                  params={"purge": ""},
+                                  headers={"User-Agent": self.__user_agent})
+
+        res_json: StreamableVideoData = _load_json(res)
+
+        return res_json
+
+    def clear_cookies(self):
+        self.__client.cookies.clear(domain=".streamable.com")
+
+    async def clip_video(self, video_url: str, title: str | None = None):
+        extractor_data = await self.video_extractor(video_url)
+        video_data = await self.__generate_clip_shortcode(extractor_data["id"], video_url,
+                                                          title=title)
+        await self.__transcode_clipped_video(video_data["shortcode"], extractor_data["headers"],
+                                             extractor_data["url"],
+                                             extractor=extractor_data["extractor"], title=title)
+        return video_data
+
+    async def get_video_url(self, video_id: str):
+        res = await self.__fetch_video_page(video_id)
+
+        _raise_on_error(res)
+
+        video_source_url = search_string(
+            res.content, OG_VIDEO_RE, '//meta[@property="og:video:secure_url"]/@content')
+        assert video_source_url != ""
+
+        return video_source_url
+
+    async def is_video_available(self, video_id: str):
+        res = await self.__client.head(self.VIDEO_PAGE_URL.format(video_id),
+                                       headers={"User-Agent": self.__user_agent})
+        return res.status_code < 400
+
+    def invalidate(self, video_id: str):
+        self.__page_cache.pop(video_id)
+
+    async def get_video_status(self, video_id: str):
+        res = await self.__fetch_video_page(video_id)
+
+        if res.status_code >= 400:
+            return False, False
+
+        return True, self.PLAYER_MARKER not in res.content
+
+    async def is_video_processing(self, video_id: str):
+        res = await self.__fetch_video_page(video_id)
+
+        _raise_on_error(res)
+
+        return self.PLAYER_MARKER not in res.content
+
+    async def poll_processing(self, *video_ids: str):
+        async with TaskGroup() as tg:
+            tasks = {video_id: tg.create_task(self.is_video_processing(video_id))
+                     for video_id in video_ids}
+
+        return {video_id: task.result() for video_id, task in tasks.items()}
+
+    async def upload_video(self, video_io: BinaryIO, filename: str = "video.mp4",
+                           title: str | None = None, upload_region: str | None = None):
+        upload_region = upload_region or "us-east-1"
+
+        try:
+            video_sz = fstat(video_io.fileno()).st_size
+
+        except (AttributeError, OSError):
+            video_io.seek(0, SEEK_END)
+            video_sz = video_io.tell()
+
+        video_io.seek(0, SEEK_SET)
+
+        hash_task = get_running_loop().run_in_executor(None, file_digest, video_io, "sha256")
+        upload_data = await self.__generate_upload_shortcode(video_sz)
+        upload_host = urlparse(upload_data["url"]).netloc
+        warm_task = create_task(self.__warm_upload_connection(upload_host))
+        await self.__update_upload_metadata(upload_data["shortcode"], filename, video_sz,
+                                            title=title)
+        video_hash = (await hash_task).hexdigest()
+        await warm_task
+
+        video_io.seek(0, SEEK_SET)
+
+        req_datetime = datetime.now(tz=timezone.utc)
+
+        aws_headers = {
+            "Host": upload_host,
+            "Content-Type": "application/octet-stream",
+            "X-AMZ-ACL": "public-read",
+            "X-AMZ-Content-SHA256": video_hash,
+            "X-AMZ-Security-Token": upload_data["credentials"]["sessionToken"],
+            "X-AMZ-Date": req_datetime.strftime("%Y%m%dT%H%M%SZ"),
+        }
+        aws_headers["Authorization"] = _aws_authorization(
+            "PUT", aws_headers, req_datetime, upload_data["credentials"]["accessKeyId"],
+            upload_data["credentials"]["secretAccessKey"], "/" + upload_data["key"], {},
+            upload_region, "s3")
+        aws_headers["Content-Length"] = str(video_sz)
+
+        res = await self.__client.put(upload_data["transcoder_options"]["url"],
+                                      content=_aiter_blocks(video_io),
+                                      headers=aws_headers | {"User-Agent": self.__user_agent})
+
+        _raise_on_error(res)
+
+        return await self.__transcode_uploaded_video(
+            upload_data["transcoder_options"]["shortcode"],
+            upload_data["transcoder_options"]["url"],
+            upload_data["transcoder_options"]["token"],
+            upload_data["transcoder_options"]["size"])
+
+    async def video_extractor(self, url: str):
+        res = await self.__client.get(self.EXTRACT_URL, params={"url": url},
+                                      headers={"User-Agent": self.__user_agent})
+
+        _raise_on_error(res)
+
+        res_json: StreamableVideoExtractorData = _load_json(res)
+
+        assert "error" not in res_json or res_json["error"] is None, \
+            "Error occurred while trying to extract video URL!\n" + \
+            res_json["error"]
+
+        return res_json
+
+
+class AsyncStreamffClient:
+    BASE_URL = "https://streamff.com"
+    GENERATE_LINK_URL = BASE_URL + "/api/videos/generate-link"
+    UPLOAD_URL = BASE_URL + "/api/videos/upload/{}"
+    VIDEO_DATA_URL = BASE_URL + "/api/videos/{}"
+    VIDEO_PAGE_URL = BASE_URL + "/v/{}"
+
+    def __init__(self, client: AsyncClient, user_agent: str | None = None):
+        self.__client = client
+        self.__user_agent = user_agent or __user_agent__
+
+    async def __generate_link(self):
+        return await self.__client.post(self.GENERATE_LINK_URL,
+                                        headers={"User-Agent": self.__user_agent})
+
+    async def get_video_data(self, video_id: str):
+        res = await self.__client.get(self.VIDEO_DATA_URL.format(video_id),
+                                      headers={"User-Agent": self.__user_agent})
+
+        _raise_on_error(res)
+
+        res_json: StreamffVideoData = _load_json(res)
+        return res_json
+
+    async def upload_video(self, video_io: BinaryIO, filename: str = "video.mp4"):
+        res = await self.__generate_link()
+
+        _raise_on_error(res)
+
+        video_id = res.text
+
+        video_mimetype = _guess_type(filename)
+        assert video_mimetype is not None and video_mimetype.startswith("video/")
+        files = {"file": (filename, video_io, video_mimetype)}
+
+        await _multipart_upload(self.__client, self.UPLOAD_URL.format(video_id), files,
+                                headers={"User-Agent": self.__user_agent})
+
+        return video_id, self.VIDEO_PAGE_URL.format(video_id)
+
+
+class AsyncStreamjaClient:
+    BASE_URL = "https://streamja.com"
+    PAGE_CACHE_SIZE = 128
+    PAGE_CACHE_TTL = 5.0
+    PLAYER_MARKER = b'id="video_container"'
+    SHORT_ID_URL = BASE_URL + "/shortId.php"
+    UPLOAD_URL = BASE_URL + "/upload.php"
+    VIDEO_PAGE_URL = BASE_URL + "/{}"
+
+    def __init__(self, client: AsyncClient, user_agent: str | None = None):
+        self.__client = client
+        self.__page_cache = _PageCache(self.PAGE_CACHE_SIZE, self.PAGE_CACHE_TTL)
+        self.__user_agent = user_agent or __user_agent__
+
+    async def __fetch_video_page(self, video_id: str):
+        res = self.__page_cache.get(video_id)
+
+        if res is not None:
+            return res
+
+        res = await self.__client.get(AsyncStreamjaClient.VIDEO_PAGE_URL.format(video_id),
+                                      headers={"User-Agent": self.__user_agent})
+
+        if res.status_code < 400:
+            self.__page_cache.put(video_id, res)
+
+        return res
+
+    async def __generate_upload_shortcode(self):
+        res = await self.__client.post(AsyncStreamjaClient.SHORT_ID_URL,
+                                       data={"new": 1},
+                                       headers={"User-Agent": self.__user_agent})
+
+        _raise_on_error(res)
+
+        res_json: StreamjaUploadUrlData = _load_json(res)
+        return res_json
+
+    def clear_cookies(self):
+        self.__client.cookies.clear(domain="streamja.com")
+
+    async def get_video_url(self, video_id: str):
+        res = await self.__fetch_video_page(video_id)
+
+        _raise_on_error(res)
+
+        vid_src_url = search_string(res.content, SOURCE_SRC_RE, "//source/@src")
+        assert vid_src_url != ""
+
+        return vid_src_url
+
+    async def is_video_available(self, video_id: str):
+        res = await self.__client.head(
+            AsyncStreamjaClient.VIDEO_PAGE_URL.format(video_id),
+            headers={"User-Agent": self.__user_agent})
+        return res.status_code < 400
+
+    def invalidate(self, video_id: str):
+        self.__page_cache.pop(video_id)
+
+    async def get_video_status(self, video_id: str):
+        res = await self.__fetch_video_page(video_id)
+
+        if res.status_code >= 400:
+            return False, False
+
+        return True, self.PLAYER_MARKER not in res.content
+
+    async def is_video_processing(self, video_id: str):
+        res = await self.__fetch_video_page(video_id)
+
+        _raise_on_error(res)
+
+        return self.PLAYER_MARKER not in res.content
+
+    async def poll_processing(self, *video_ids: str):
+        async with TaskGroup() as tg:
+            tasks = {video_id: tg.create_task(self.is_video_processing(video_id))
+                     for video_id in video_ids}
+
+        return {video_id: task.result() for video_id, task in tasks.items()}
+
+    async def upload_video(self, video_io: BinaryIO, filename: str = "video.mp4"):
+        video_mimetype = _guess_type(filename)
+        assert video_mimetype is not None and video_mimetype.startswith("video/")
+        files = {"file": (filename, video_io, video_mimetype)}
+        generate_shortcode_data = await self.__generate_upload_shortcode()
+
+        if generate_shortcode_data["status"] == 0 or "error" in generate_shortcode_data:
+            raise Exception("Error occurred while trying to generate Streamja video ID",
+                            generate_shortcode_data)
+
+        else:
+            assert "shortId" in generate_shortcode_data
+            assert "uploadUrl" in generate_shortcode_data
+
+        short_id = generate_shortcode_data["shortId"]
+        res = await _multipart_upload(self.__client, AsyncStreamjaClient.UPLOAD_URL, files,
+                                      params={"shortId": short_id},
+                                      headers={"User-Agent": self.__user_agent})
+
+        res_json: StreamjaUploadData = _load_json(res)
+
+        if res_json["status"] == 0 or "error" in res_json:
+            raise Exception("Error occurred while trying to upload video to Streamja video ID " +
+                            short_id, res_json)
+
+        else:
+            assert "image" in res_json
+            assert "shortId" in res_json
+            assert "url" in res_json
+
+        return res_json
+
+
+class AsyncVHPClient:
+    LIMITS = Limits(max_connections=256, max_keepalive_connections=64)
+    __CLIENT = None
+
+    def __init__(self, user_agent: str | None = None, limits: Limits | None = None):
+        if AsyncVHPClient.__CLIENT is None:
+            AsyncVHPClient.__CLIENT = AsyncClient(transport=AsyncRetryTransport(
+                http2=h2_available, limits=limits or self.LIMITS))
+            AsyncVHPClient.__CLIENT.follow_redirects = True
+
+        self.__user_agent = user_agent or __user_agent__
+
+    async def get_media_from_url(self, url: str):
+        res = await AsyncVHPClient.__CLIENT.get(url,
+                                                headers={"User-Agent": self.__user_agent})
+        res.raise_for_status()
+        return BytesIO(await res.aread())
+
+    async def stream_media_from_url(self, url: str, chunk_size: int = 1 << 20):
+        async with AsyncVHPClient.__CLIENT.stream(
+                "GET", url, headers={"User-Agent": self.__user_agent}) as res:
+            res.raise_for_status()
+
+            async for chunk in res.aiter_bytes(chunk_size=chunk_size):
+                yield chunk
+
+    @cached_property
+    def gfycat(self):
+        return AsyncGfyCatClient(AsyncVHPClient.__CLIENT, user_agent=self.__user_agent)
+
+    @cached_property
+    def imgur(self):
+        return AsyncImgurClient(AsyncVHPClient.__CLIENT, user_agent=self.__user_agent)
+
+    @cached_property
+    def streamable(self):
+        return AsyncStreamableClient(AsyncVHPClient.__CLIENT, user_agent=self.__user_agent)
+
+    @cached_property
+    def streamff(self):
+        return AsyncStreamffClient(AsyncVHPClient.__CLIENT, user_agent=self.__user_agent)
+
+    @cached_property
+    def streamja(self):
+        return AsyncStreamjaClient(AsyncVHPClient.__CLIENT, user_agent=self.__user_agent)
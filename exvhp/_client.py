@@ -13,21 +13,29 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
-from hashlib import sha256
-from hmac import new as hmac_new
+from functools import cached_property, lru_cache
+from hashlib import file_digest, sha256
+from hmac import digest as hmac_digest
+from importlib.metadata import PackageNotFoundError, version
 from io import BytesIO, SEEK_END, SEEK_SET
-from mimetypes import guess_type
+from json import dumps as json_dumps
+from mimetypes import guess_type, init as mimetypes_init
+from os import fstat
 from pathlib import Path
-from pkg_resources import require
+from queue import Queue
+from random import uniform
+from threading import Condition, Lock, Thread
+from time import monotonic, sleep
 from typing import BinaryIO, Dict, Literal
-from urllib.parse import urlencode, urlparse
+from urllib.parse import quote, urlparse
 
-from bs4 import BeautifulSoup
-from bs4.element import Tag
-from httpx import Client
+from httpx import Client, HTTPError, HTTPTransport, Limits, Request, RequestNotRead, \
+    Response, TransportError
 
+from ._html import OG_VIDEO_RE, SOURCE_SRC_RE, search_string
 from .type import (
     GfyCatCreatePost,
     GfyCatNewPost,
@@ -57,105 +65,390 @@ try:
 except ImportError:
     h2_available = False
 
-__version__ = require(__package__)[0].version
+try:
+    from orjson import dumps as orjson_dumps, loads as orjson_loads
+    orjson_available = True
+
+except ImportError:
+    orjson_available = False
+
+try:
+    __version__ = version(__package__)
+
+except PackageNotFoundError:
+    __version__ = "0.0.0"
+
 __user_agent__ = f"{__package__}/{__version__}"
 
+mimetypes_init()
+
+_ALLOWED_METHODS = frozenset(("CONNECT", "DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST",
+                              "PUT", "TRACE"))
+
+
+@lru_cache(maxsize=1024)
+def _guess_type(filename: str):
+    return guess_type(filename, strict=False)[0]
+
+
+@lru_cache(maxsize=32)
+def _aws_api_signing_key(key_secret: str, datestamp: str, region: str, service: str):
+    key_date = hmac_digest(f"AWS4{key_secret}".encode(encoding="utf8"),
+                           datestamp.encode(encoding="utf8"), sha256)
+    key_region = hmac_digest(key_date, region.encode(encoding="utf8"), sha256)
+    key_service = hmac_digest(key_region, service.encode(encoding="utf8"), sha256)
+    return hmac_digest(key_service, b"aws4_request", sha256)
+
+
+def _dump_json(payload) -> bytes:
+    if orjson_available:
+        return orjson_dumps(payload)
+
+    return json_dumps(payload, separators=(",", ":")).encode(encoding="utf8")
+
+
+def _load_json(res: Response):
+    if orjson_available:
+        return orjson_loads(res.content)
+
+    return res.json()
+
+
+def _raise_on_error(res: Response):
+    if res.status_code >= 400:
+        res.raise_for_status()
+
+
+def _json_request(client: Client, method: str, url: str, payload, *,
+                  params: dict | None = None, headers: dict | None = None):
+    if payload is None:
+        res = client.request(method, url, params=params, headers=headers)
+
+    else:
+        res = client.request(method, url, content=_dump_json(payload), params=params,
+                             headers={"Content-Type": "application/json"} | (headers or {}))
+
+    _raise_on_error(res)
+
+    return res
+
+
+def _multipart_upload(client: Client, url: str, files: dict, *, data: dict | None = None,
+                      params: dict | None = None, headers: dict | None = None):
+    res = client.post(url, data=data, files=files, params=params, headers=headers)
+
+    _raise_on_error(res)
+
+    return res
+
+
+class _PageCache:
+    def __init__(self, maxsize: int, ttl: float):
+        self.__entries: dict[str, tuple[float, Response]] = {}
+        self.__lock = Lock()
+        self.__maxsize = maxsize
+        self.__ttl = ttl
+
+    def get(self, key: str):
+        with self.__lock:
+            entry = self.__entries.get(key)
+
+            if entry is None:
+                return None
+
+            if monotonic() >= entry[0]:
+                self.__entries.pop(key, None)
+                return None
+
+            return entry[1]
+
+    def pop(self, key: str):
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+    def put(self, key: str, res: Response):
+        now = monotonic()
+
+        with self.__lock:
+            for expired in [k for k, entry in self.__entries.items() if now >= entry[0]]:
+                del self.__entries[expired]
+
+            if len(self.__entries) >= self.__maxsize:
+                del self.__entries[next(iter(self.__entries))]
+
+            self.__entries[key] = (now + self.__ttl, res)
+
+
+class _PrefetchReader:
+    BLOCK_SIZE = 1 << 22
+    QUEUE_DEPTH = 2
+
+    def __init__(self, source: BinaryIO, size: int):
+        self.__blocks = Queue(maxsize=self.QUEUE_DEPTH)
+        self.__buffer = b""
+        self.__done = False
+        self.__size = size
+        self.__source = source
+        self.__started = False
+
+    def __produce(self):
+        try:
+            while block := self.__source.read(self.BLOCK_SIZE):
+                self.__blocks.put(block)
+
+            self.__blocks.put(None)
+
+        except Exception as exc:
+            self.__blocks.put(exc)
+
+    def __iter__(self):
+        while block := self.read(self.BLOCK_SIZE):
+            yield block
+
+    def read(self, size: int = -1):
+        if not self.__started:
+            self.__started = True
+            Thread(target=self.__produce, daemon=True).start()
+
+        while not self.__done and (size < 0 or len(self.__buffer) < size):
+            block = self.__blocks.get()
+
+            if block is None:
+                self.__done = True
+
+            elif isinstance(block, Exception):
+                self.__done = True
+                raise block
+
+            else:
+                self.__buffer += block
+
+        data = self.__buffer if size < 0 else self.__buffer[:size]
+        self.__buffer = self.__buffer[len(data):]
+        return data
+
+    def seek(self, offset: int, whence: int = SEEK_SET):
+        return self.__size + offset if whence == SEEK_END else offset
+
+    def tell(self):
+        return 0
+
+
+def _replayable(request: Request):
+    try:
+        request.content
+
+    except RequestNotRead:
+        return False
+
+    return True
+
+
+def _retry_delay(attempt: int, max_backoff: float, retry_after: str | None = None):
+    if retry_after is not None:
+        try:
+            return max(float(retry_after), 0.0)
+
+        except ValueError:
+            try:
+                retry_date = parsedate_to_datetime(retry_after)
+
+            except ValueError:
+                pass
+
+            else:
+                if retry_date.tzinfo is None:
+                    retry_date = retry_date.replace(tzinfo=timezone.utc)
+
+                return max((retry_date - datetime.now(tz=timezone.utc)).total_seconds(), 0.0)
+
+    return min(2 ** attempt, max_backoff) + uniform(0, 1)
+
+
+class RetryTransport(HTTPTransport):
+    """HTTP transport retrying transient failures with exponential backoff.
+
+    Connection errors and 429/5xx responses are retried up to MAX_RETRIES
+    attempts with full-jitter backoff, honouring Retry-After when the server
+    sends one. Requests whose body stream cannot be replayed (e.g. one-shot
+    upload readers) are never retried."""
+    MAX_BACKOFF = 30.0
+    MAX_RETRIES = 5
+    RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+    def handle_request(self, request: Request):
+        for attempt in range(self.MAX_RETRIES - 1):
+            try:
+                res = super().handle_request(request)
+
+            except TransportError:
+                if not _replayable(request):
+                    raise
+
+                retry_after = None
+
+            else:
+                if res.status_code not in self.RETRY_STATUSES or not _replayable(request):
+                    return res
+
+                retry_after = res.headers.get("Retry-After")
+                res.close()
+
+            sleep(_retry_delay(attempt, self.MAX_BACKOFF, retry_after))
+
+        return super().handle_request(request)
+
+
+def _aws_authorization(method: str, headers: dict[str, str], req_time: datetime,
+                       access_key_id: str, secret_access_key: str, uri: str,
+                       query: Dict[str, str], region: str, service: str):
+    method = method.upper()
+
+    if method not in _ALLOWED_METHODS:
+        raise ValueError("Invalid HTTP method specified!")
+
+    hd = {hk.lower(): " ".join(hv.split())
+          for hk, hv in sorted(headers.items(), key=lambda kv: kv[0].lower())}
+
+    if "x-amz-content-sha256" not in hd:
+        raise ValueError("Must specify Content SHA256 for AWS request")
+
+    algo = "AWS4-HMAC-SHA256"
+    datestamp = req_time.strftime("%Y%m%d")
+    amz_date = req_time.strftime("%Y%m%dT%H%M%SZ")
+    cs = "/".join((datestamp, region, service, "aws4_request"))
+    sh = ";".join(hd.keys())
+
+    hs = "".join(f"{hk}:{hv}\n" for hk, hv in hd.items())
+    qs = "&".join(f"{quote(qk, safe='')}={quote(qv, safe='')}"
+                  for qk, qv in sorted(query.items()))
+    rs = "\n".join((method, uri, qs, hs, sh, hd["x-amz-content-sha256"]))
+    ss = "\n".join((algo, amz_date, cs,
+                    sha256(rs.encode(encoding="utf8")).hexdigest()))
+    signature = hmac_digest(
+        _aws_api_signing_key(secret_access_key, datestamp, region, service),
+        ss.encode(encoding="utf8"), sha256).hex()
+
+    return f"{algo} Credential={access_key_id}/{cs}, SignedHeaders={sh}, Signature={signature}"
+
 
 class GfyCatClient:
     API_URL = "https://api.gfycat.com"
     WEBLOGIN_URL = "https://weblogin.gfycat.com"
     WEBTOKEN_ACCESS_KEY = "Anr96uuqt9EdamSCwK4txKPjMsf2M95Rfa5FLLhPFucu8H5HTzeutyAa"
+    GFYCATS_URL = API_URL + "/v1/gfycats"
+    GFYCAT_URL = API_URL + "/v1/gfycats/{}"
+    GFYCAT_STATUS_URL = API_URL + "/v1/gfycats/fetch/status/{}"
+    WEBTOKEN_URL = WEBLOGIN_URL + "/oauth/webtoken"
+    TOKEN_REFRESH_WINDOW = timedelta(minutes=5)
+    __TOKEN_CACHE: dict[str, tuple[str, datetime]] = {}
 
     def __init__(self, client: Client, user_agent: str | None = None):
+        self.__auth_headers = None
         self.__authorization = None
         self.__client = client
         self.__expires_at = None
+        self.__refresh_thread = None
+        self.__token_lock = Lock()
         self.__user_agent = user_agent
-        self.__obtain_authorization()
+
+    def __apply_token(self, authorization: str, expires_at: datetime):
+        self.__authorization = authorization
+        self.__expires_at = expires_at
+        self.__auth_headers = {"Authorization": authorization,
+                               "User-Agent": self.__user_agent or __user_agent__}
 
     def __obtain_authorization(self):
-        res = self.__client.post(f"{self.WEBLOGIN_URL}/oauth/webtoken",
-                                 json={"access_key": self.WEBTOKEN_ACCESS_KEY},
-                                 headers={"User-Agent": self.__user_agent or __user_agent__})
+        cached = GfyCatClient.__TOKEN_CACHE.get(self.WEBTOKEN_ACCESS_KEY)
 
-        if res.status_code >= 400:
-            res.raise_for_status()
+        if cached is not None and \
+                datetime.now(tz=timezone.utc) < cached[1] - self.TOKEN_REFRESH_WINDOW:
+            self.__apply_token(*cached)
+            return
+
+        res = _json_request(self.__client, "POST", self.WEBTOKEN_URL,
+                            {"access_key": self.WEBTOKEN_ACCESS_KEY},
+                            headers={"User-Agent": self.__user_agent or __user_agent__})
 
-        token_data: GfyCatWebToken = res.json()
+        token_data: GfyCatWebToken = _load_json(res)
         access_token = token_data["access_token"]
         token_type = token_data["token_type"]
         expires_in = token_data["expires_in"]
 
-        self.__expires_at = parsedate_to_datetime(res.headers["Date"]) + \
-            timedelta(seconds=expires_in)
-        self.__authorization = f"{token_type} {access_token}"
+        expires_at = parsedate_to_datetime(res.headers["Date"]) + timedelta(seconds=expires_in)
+        self.__apply_token(f"{token_type} {access_token}", expires_at)
+        GfyCatClient.__TOKEN_CACHE[self.WEBTOKEN_ACCESS_KEY] = (self.__authorization,
+                                                                expires_at)
+
+    def __ensure_authorization(self):
+        now = datetime.now(tz=timezone.utc)
+
+        if self.__expires_at is None or now >= self.__expires_at:
+            with self.__token_lock:
+                if self.__expires_at is None or \
+                        datetime.now(tz=timezone.utc) >= self.__expires_at:
+                    self.__obtain_authorization()
+
+        elif self.__expires_at - now <= self.TOKEN_REFRESH_WINDOW and \
+                (self.__refresh_thread is None or not self.__refresh_thread.is_alive()):
+            self.__refresh_thread = Thread(target=self.__refresh_authorization, daemon=True)
+            self.__refresh_thread.start()
+
+    def __refresh_authorization(self):
+        with self.__token_lock:
+            if self.__expires_at - datetime.now(tz=timezone.utc) <= self.TOKEN_REFRESH_WINDOW:
+                self.__obtain_authorization()
 
     def delete_post(self, gfyname: str):
-        if datetime.now(tz=timezone.utc) >= self.__expires_at:
-            self.__obtain_authorization()
+        self.__ensure_authorization()
 
-        res = self.__client.delete(f"{self.API_URL}/v1/gfycats/{gfyname}",
-                                   headers={"Authorization": self.__authorization,
-                                            "User-Agent": self.__user_agent or __user_agent__})
+        res = self.__client.delete(self.GFYCAT_URL.format(gfyname),
+                                   headers=self.__auth_headers)
 
-        if res.status_code >= 400:
-            res.raise_for_status()
+        _raise_on_error(res)
 
         return res.status_code < 400
 
     def get_post_info(self, gfyid: str):
-        if datetime.now(tz=timezone.utc) >= self.__expires_at:
-            self.__obtain_authorization()
+        self.__ensure_authorization()
 
-        res = self.__client.get(f"{self.API_URL}/v1/gfycats/{gfyid}",
-                                headers={"Authorization": self.__authorization,
-                                         "User-Agent": self.__user_agent or __user_agent__})
+        res = self.__client.get(self.GFYCAT_URL.format(gfyid),
+                                headers=self.__auth_headers)
 
-        if res.status_code >= 400:
-            res.raise_for_status()
+        _raise_on_error(res)
 
-        post_info: GfyCatPostInfo = res.json()
+        post_info: GfyCatPostInfo = _load_json(res)
 
         return post_info
 
     def get_upload_status(self, gfyid: str):
-        if datetime.now(tz=timezone.utc) >= self.__expires_at:
-            self.__obtain_authorization()
+        self.__ensure_authorization()
 
-        res = self.__client.get(f"{self.API_URL}/v1/gfycats/fetch/status/{gfyid}",
-                                headers={"Authorization": self.__authorization,
-                                         "User-Agent": self.__user_agent or __user_agent__})
+        res = self.__client.get(self.GFYCAT_STATUS_URL.format(gfyid),
+                                headers=self.__auth_headers)
 
-        if res.status_code >= 400:
-            res.raise_for_status()
+        _raise_on_error(res)
 
-        post_status: GfyCatUploadStatus = res.json()
+        post_status: GfyCatUploadStatus = _load_json(res)
 
         return post_status
 
     def new_video_post(self, post_data: GfyCatCreatePost | None = None):
-        if datetime.now(tz=timezone.utc) >= self.__expires_at:
-            self.__obtain_authorization()
-
-        res = self.__client.post(f"{self.API_URL}/v1/gfycats", json=post_data,
-                                 headers={"Authorization": self.__authorization,
-                                          "User-Agent": self.__user_agent or __user_agent__})
+        self.__ensure_authorization()
 
-        if res.status_code >= 400:
-            res.raise_for_status()
+        res = _json_request(self.__client, "POST", self.GFYCATS_URL, post_data,
+                            headers=self.__auth_headers)
 
-        new_post_data: GfyCatNewPost = res.json()
+        new_post_data: GfyCatNewPost = _load_json(res)
 
         return new_post_data
 
     def upload_video(self, gfyname: str, media_io: BinaryIO, filename: str = "video.mp4",
                      upload_type: str = "filedrop.gfycat.com"):
-        res = self.__client.post(f"https://{upload_type}/", data={"key": gfyname},
-                                 files={"file": (filename, media_io, guess_type(filename)[0])},
-                                 headers={"User-Agent": self.__user_agent or __user_agent__})
-
-        if res.status_code >= 400:
-            res.raise_for_status()
+        res = _multipart_upload(self.__client, f"https://{upload_type}/",
+                                {"file": (filename, media_io, _guess_type(filename))},
+                                data={"key": gfyname},
+                                headers={"User-Agent": self.__user_agent or __user_agent__})
 
         return res.status_code < 400
 
@@ -164,110 +457,140 @@ class ImgurClient:
     api_url = "https://api.imgur.com"
     base_url = "https://imgur.com"
     client_id = "546c25a59c58ad7"
+    album_add_url = api_url + "/3/album/{}/add"
+    album_medias_url = api_url + "/post/v1/albums/{}"
+    album_url = api_url + "/3/album/{}"
+    albums_url = api_url + "/3/album"
+    checkcaptcha_url = api_url + "/3/upload/checkcaptcha"
+    image_url = api_url + "/3/image/{}"
+    images_url = api_url + "/3/image"
+    media_url = api_url + "/post/v1/media/{}"
+    upload_poll_url = base_url + "/upload/poll"
 
     def __init__(self, client: Client | None = None, user_agent: str | None = None):
         client = client or Client(http2=h2_available)
         client.headers["User-Agent"] = user_agent or __user_agent__
         self.__client = client
+        self.__media_params = {"client_id": self.client_id, "include": "media"}
+        self.__params = {"client_id": self.client_id}
 
     def add_media_to_album(self, album_deletehash: str, *media_deletehashes: str):
-        res = self.__client.post(f"{self.api_url}/3/album/{album_deletehash}/add",
-                                 json={"deletehashes": [dh for dh in media_deletehashes]},
-                                 params={"client_id": self.client_id})
+        res = _json_request(self.__client, "POST", self.album_add_url.format(album_deletehash),
+                            {"deletehashes": list(media_deletehashes)},
+                            params=self.__params)
 
-        if res.status_code >= 400:
-            res.raise_for_status()
-
-        data: ImgurAddMediaToAlbumResponse = res.json()
+        data: ImgurAddMediaToAlbumResponse = _load_json(res)
 
         return data
 
     def check_captcha(self, total_upload: int, g_recaptcha_response: str | None = None):
-        res = self.__client.post(f"{self.api_url}/3/upload/checkcaptcha",
-                                 json={
-                                     "g-recaptcha-response": g_recaptcha_response,
-                                     "total_upload": total_upload,
-                                 },
-                                 params={"client_id": self.client_id})
-
-        if res.status_code >= 400:
-            res.raise_for_status()
+        res = _json_request(self.__client, "POST", self.checkcaptcha_url,
+                            {
+                                "g-recaptcha-response": g_recaptcha_response,
+                                "total_upload": total_upload,
+                            },
+                            params=self.__params)
 
-        data: ImgurCheckCaptchaResponse = res.json()
+        data: ImgurCheckCaptchaResponse = _load_json(res)
 
         return data
 
-    def generate_album(self):
-        res = self.__client.post(f"{self.api_url}/3/album", params={"client_id": self.client_id},
-                                 json={})
+    def generate_album(self, *media_deletehashes: str, title: str | None = None,
+                       description: str | None = None, cover: str | None = None):
+        album_data = {}
 
-        if res.status_code >= 400:
-            res.raise_for_status()
+        if len(media_deletehashes) > 0:
+            album_data["deletehashes"] = list(media_deletehashes)
+
+        if title:
+            album_data["title"] = title
+
+        if description:
+            album_data["description"] = description
+
+        if cover:
+            album_data["cover"] = cover
 
-        data: ImgurGenerateAlbumResponse = res.json()
+        res = _json_request(self.__client, "POST", self.albums_url, album_data,
+                            params=self.__params)
+
+        data: ImgurGenerateAlbumResponse = _load_json(res)
 
         return data
 
     def get_album_medias(self, album_id: str):
-        res = self.__client.get(f"{self.api_url}/post/v1/albums/{album_id}",
-                                params={"client_id": self.client_id, "include": "media"})
+        res = self.__client.get(self.album_medias_url.format(album_id),
+                                params=self.__media_params)
 
-        if res.status_code >= 400:
-            res.raise_for_status()
+        _raise_on_error(res)
 
-        data: ImgurMedia = res.json()
+        data: ImgurMedia = _load_json(res)
 
         return data
 
     def get_media(self, media_id: str):
-        res = self.__client.get(f"{self.api_url}/post/v1/media/{media_id}",
-                                params={"client_id": self.client_id, "include": "media"})
+        res = self.__client.get(self.media_url.format(media_id),
+                                params=self.__media_params)
 
-        if res.status_code >= 400:
-            res.raise_for_status()
+        _raise_on_error(res)
 
-        data: ImgurMedia = res.json()
+        data: ImgurMedia = _load_json(res)
 
         return data
 
     def poll_video_tickets(self, *tickets: str):
-        res = self.__client.get(f"{self.base_url}/upload/poll",
-                                params={
-                                    "client_id": self.client_id,
-                                    "tickets[]": [ticket for ticket in tickets],
-                                })
+        res = self.__client.get(self.upload_poll_url,
+                                params=self.__params | {"tickets[]": list(tickets)})
 
-        if res.status_code >= 400:
-            res.raise_for_status()
+        _raise_on_error(res)
 
-        poll_data: ImgurUploadPollResponse = res.json()
+        poll_data: ImgurUploadPollResponse = _load_json(res)
 
         return poll_data
 
+    def wait_for_tickets(self, *tickets: str, initial: float = 1.0,
+                         max_interval: float = 10.0, factor: float = 2.0,
+                         max_attempts: int = 60):
+        pending = set(tickets)
+        done: dict[str, str] = {}
+        attempt = 0
+        interval = min(max_interval, initial)
+
+        while pending and attempt < max_attempts:
+            poll_data = self.poll_video_tickets(*sorted(pending))
+            done |= poll_data["data"]["done"]
+            pending.difference_update(done)
+
+            if not pending:
+                break
+
+            sleep(uniform(0, interval))
+            interval = min(max_interval, interval * factor)
+            attempt += 1
+
+        return done
+
     def update_album(self, album_deletehash: str, title: str | None = None,
                      description: str | None = None, cover_id: str | None = None,
                      *media_deletehashes: str):
         album_data = {}
 
         if cover_id:
-            album_data.update(cover=cover_id)
+            album_data["cover"] = cover_id
 
         if title:
-            album_data.update(title=title)
+            album_data["title"] = title
 
         if description:
-            album_data.update(description=description)
+            album_data["description"] = description
 
         if len(media_deletehashes) > 0:
-            album_data.update(deletehashes=[dh for dh in media_deletehashes])
+            album_data["deletehashes"] = list(media_deletehashes)
 
-        res = self.__client.put(f"{self.api_url}/3/album/{album_deletehash}", json=album_data,
-                                params={"client_id": self.client_id})
+        res = _json_request(self.__client, "PUT", self.album_url.format(album_deletehash),
+                            album_data, params=self.__params)
 
-        if res.status_code >= 400:
-            res.raise_for_status()
-
-        data: ImgurUpdateMediaResponse = res.json()
+        data: ImgurUpdateMediaResponse = _load_json(res)
 
         return data
 
@@ -276,25 +599,22 @@ class ImgurClient:
         media_data = {}
 
         if title:
-            media_data.update(title=title)
+            media_data["title"] = title
 
         if description:
-            media_data.update(description=description)
-
-        res = self.__client.put(f"{self.api_url}/3/image/{media_deletehash}", json=media_data,
-                                params={"client_id": self.client_id})
+            media_data["description"] = description
 
-        if res.status_code >= 400:
-            res.raise_for_status()
+        res = _json_request(self.__client, "PUT", self.image_url.format(media_deletehash),
+                            media_data, params=self.__params)
 
-        data: ImgurUpdateMediaResponse = res.json()
+        data: ImgurUpdateMediaResponse = _load_json(res)
 
         return data
 
     def upload_media(self, media_io: BinaryIO, media_filename: str,
                      media_mimetype: str | None = None):
         if not media_mimetype:
-            media_mimetype = guess_type(media_filename, strict=False)[0]
+            media_mimetype = _guess_type(media_filename)
 
         assert media_mimetype is not None, "Unable to guess media MIME type!"
         assert media_mimetype.startswith(("image/", "video/"))
@@ -302,113 +622,129 @@ class ImgurClient:
         media_name = "image" if media_mimetype.startswith("image/") else "video"
         files = {media_name: (media_filename, media_io, media_mimetype)}
 
-        res = self.__client.post(f"{self.api_url}/3/image", files=files,
-                                 params={"client_id": self.client_id})
+        res = _multipart_upload(self.__client, self.images_url, files,
+                                params=self.__params)
 
-        if res.status_code >= 400:
-            res.raise_for_status()
-
-        data: ImgurUploadedImageResponse | ImgurUploadTicketResponse = res.json()
+        data: ImgurUploadedImageResponse | ImgurUploadTicketResponse = _load_json(res)
 
         return data
 
 
+class ImgurTicketPoller:
+    BATCH_DELAY = 0.2
+    BATCH_LIMIT = 32
+
+    def __init__(self, client: ImgurClient):
+        self.__client = client
+        self.__cond = Condition()
+        self.__pending: dict[str, Future] = {}
+        self.__worker = None
+
+    def submit(self, ticket: str) -> Future:
+        with self.__cond:
+            future = self.__pending.get(ticket)
+
+            if future is None:
+                future = Future()
+                self.__pending[ticket] = future
+
+                if self.__worker is None:
+                    self.__worker = Thread(target=self.__drain, daemon=True)
+                    self.__worker.start()
+
+                elif len(self.__pending) >= self.BATCH_LIMIT:
+                    self.__cond.notify()
+
+            return future
+
+    def __drain(self):
+        while True:
+            with self.__cond:
+                if not self.__pending:
+                    self.__worker = None
+                    return
+
+                self.__cond.wait(timeout=self.BATCH_DELAY)
+                batch = dict(self.__pending)
+                self.__pending.clear()
+
+            try:
+                poll_data = self.__client.poll_video_tickets(*batch)
+
+            except Exception as exc:
+                for future in batch.values():
+                    future.set_exception(exc)
+
+            else:
+                for future in batch.values():
+                    future.set_result(poll_data)
+
+
 class StreamableClient:
     API_URL = "https://ajax.streamable.com"
     BASE_URL = "https://streamable.com"
     FRONTEND_REACT_VERSION = "5a6120a04b6db864113d706cc6a6131cb8ca3587"
-
-    @staticmethod
-    def __hmac_sha256_sign(key: bytes, msg: str):
-        return hmac_new(key, msg.encode(encoding="utf8"), digestmod=sha256).digest()
-
-    @staticmethod
-    def __aws_api_signing_key(key_secret: str, datestamp: str, region: str, service: str):
-        key_date = StreamableClient.__hmac_sha256_sign(
-            f"AWS4{key_secret}".encode(encoding="utf8"), datestamp)
-        key_region = StreamableClient.__hmac_sha256_sign(key_date, region)
-        key_service = StreamableClient.__hmac_sha256_sign(key_region, service)
-        key_signing = StreamableClient.__hmac_sha256_sign(key_service, "aws4_request")
-        return key_signing
-
-    @staticmethod
-    def __aws_authorization(method: str, headers: dict[str, str], req_time: datetime,
-                            access_key_id: str, secret_access_key: str, uri: str,
-                            query: Dict[str, str], region: str, service: str):
-        method = method.upper()
-        assert method in ("CONNECT", "DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT",
-                          "TRACE"), "Invalid HTTP method specified!"
-
-        hd = {}
-        qd = {}
-
-        for hk, hv in dict(sorted(headers.items())).items():
-            hd[hk.lower()] = hv.strip()
-
-        assert "x-amz-content-sha256" in hd, \
-            "Must specify Content SHA256 for AWS request"
-
-        algo = "AWS4-HMAC-SHA256"
-        cs = "/".join([req_time.strftime("%Y%m%d"), region, service, "aws4_request"])
-        sh = ";".join(hd.keys())
-
-        for qk, qv in dict(sorted(query.items())).items():
-            qd[urlencode(qk)] = urlencode(qv)
-
-        hs = "".join([f"{hk}:{hv}\n" for hk, hv in hd.items()])
-        qs = "&".join([f"{qk}:{qv}" for qk, qv in qd.items()])
-        rs = "\n".join((method, uri, qs, hs, sh, hd["x-amz-content-sha256"]))
-        ss = "\n".join((algo, req_time.strftime("%Y%m%dT%H%M%SZ"), cs,
-                        sha256(rs.encode(encoding="utf8")).hexdigest()))
-        signature = hmac_new(
-            StreamableClient.__aws_api_signing_key(secret_access_key, req_time.strftime("%Y%m%d"),
-                                                   region, service),
-            ss.encode(encoding="utf8"),
-            digestmod=sha256,
-        ).hexdigest()
-
-        return f"{algo} Credential={access_key_id}/{cs}, SignedHeaders={sh}, Signature={signature}"
+    EXTRACT_URL = API_URL + "/extract"
+    PAGE_CACHE_SIZE = 128
+    PAGE_CACHE_TTL = 5.0
+    PLAYER_MARKER = b'id="player-content"'
+    SHORTCODE_URL = API_URL + "/shortcode"
+    TRANSCODE_URL = API_URL + "/transcode/{}"
+    VIDEO_PAGE_URL = BASE_URL + "/{}"
+    VIDEO_URL = API_URL + "/videos/{}"
+    VIDEOS_URL = API_URL + "/videos"
 
     def __init__(self, client: Client, user_agent: str | None = None):
         self.__client = client
+        self.__page_cache = _PageCache(self.PAGE_CACHE_SIZE, self.PAGE_CACHE_TTL)
         self.__user_agent = user_agent or __user_agent__
 
-    def __generate_clip_shortcode(self, video_id: str, video_source: str,
-                                  title: str | None = None):
-        res = self.__client.post(f"{self.API_URL}/videos",
-                                 headers={"User-Agent": self.__user_agent},
-                                 json={
-                                     "extract_id": video_id,
-                                     "extractor": (
-                                       "streamable"
-                                       if video_source.startswith("https://streamable.com")
-                                       else "generic"
-                                     ),
-                                     "source": video_source,
-                                     "status": 1,
-                                     "title": title,
-                                     "upload_source": "clip",
-                                 })
+    def __fetch_video_page(self, video_id: str):
+        res = self.__page_cache.get(video_id)
 
-        if res.status_code >= 400:
-            res.raise_for_status()
+        if res is not None:
+            return res
+
+        res = self.__client.get(StreamableClient.VIDEO_PAGE_URL.format(video_id),
+                                headers={"User-Agent": self.__user_agent})
+
+        if res.status_code < 400:
+            self.__page_cache.put(video_id, res)
+
+        return res
 
-        res_json: StreamableVideoData = res.json()
+    def __generate_clip_shortcode(self, video_id: str, video_source: str,
+                                  title: str | None = None):
+        res = _json_request(self.__client, "POST", self.VIDEOS_URL,
+                            {
+                                "extract_id": video_id,
+                                "extractor": (
+                                  "streamable"
+                                  if video_source.startswith("https://streamable.com")
+                                  else "generic"
+                                ),
+                                "source": video_source,
+                                "status": 1,
+                                "title": title,
+                                "upload_source": "clip",
+                            },
+                            headers={"User-Agent": self.__user_agent})
+
+        res_json: StreamableVideoData = _load_json(res)
 
         return res_json
 
     def __generate_upload_shortcode(self, video_sz: int):
-        res = self.__client.get(f"{self.API_URL}/shortcode",
+        res = self.__client.get(self.SHORTCODE_URL,
                                 headers={"User-Agent": self.__user_agent},
                                 params={
                                     "version": self.FRONTEND_REACT_VERSION,
                                     "size": video_sz,
                                 })
 
-        if res.status_code >= 400:
-            res.raise_for_status()
+        _raise_on_error(res)
 
-        res_json: StreamableUploadData = res.json()
+        res_json: StreamableUploadData = _load_json(res)
 
         return res_json
 
@@ -416,59 +752,58 @@ class StreamableClient:
                                   video_url: str,
                                   extractor: Literal["streamable", "generic"] = "generic",
                                   mute: bool = False, title: str | None = None):
-        res = self.__client.post(f"{self.API_URL}/transcode/{shortcode}",
-                                 headers={"User-Agent": self.__user_agent},
-                                 json={
-                                     "extractor": extractor,
-                                     "headers": video_headers,
-                                     "mute": mute,
-                                     "shortcode": shortcode,
-                                     "thumb_offset": None,
-                                     "title": title,
-                                     "upload_source": "clip",
-                                     "url": video_url,
-                                 })
-
-        if res.status_code >= 400:
-            res.raise_for_status()
-
-        res_json: StreamableVideoData = res.json()
+        res = _json_request(self.__client, "POST", self.TRANSCODE_URL.format(shortcode),
+                            {
+                                "extractor": extractor,
+                                "headers": video_headers,
+                                "mute": mute,
+                                "shortcode": shortcode,
+                                "thumb_offset": None,
+                                "title": title,
+                                "upload_source": "clip",
+                                "url": video_url,
+                            },
+                            headers={"User-Agent": self.__user_agent})
+
+        res_json: StreamableVideoData = _load_json(res)
 
         return res_json
 
     def __transcode_uploaded_video(self, shortcode: str, url: str, transcoder_token: str,
                                    video_sz: int):
-        res = self.__client.post(f"{self.API_URL}/transcode/{shortcode}",
-                                 json={
-                                     "shortcode": shortcode,
-                                     "size": video_sz,
-                                     "token": transcoder_token,
-                                     "upload_source": "web",
-                                     "url": url,
-                                 })
+        res = _json_request(self.__client, "POST", self.TRANSCODE_URL.format(shortcode),
+                            {
+                                "shortcode": shortcode,
+                                "size": video_sz,
+                                "token": transcoder_token,
+                                "upload_source": "web",
+                                "url": url,
+                            })
 
-        if res.status_code >= 400:
-            res.raise_for_status()
-
-        res_json: StreamableVideoData = res.json()
+        res_json: StreamableVideoData = _load_json(res)
 
         return res_json
 
-    def __update_upload_metadata(self, shortcode: str, filename: str, video_sz: int,
-                                 title: str | None = None):
-        res = self.__client.put(f"{self.API_URL}/videos/{shortcode}", params={"purge": ""},
-                                headers={"User-Agent": self.__user_agent},
-                                json={
-                                    "original_name": filename,
-                                    "original_size": video_sz,
-                                    "title": title or Path(filename).stem,
-                                    "upload_source": "web",
-                                })
+    def __warm_upload_connection(self, host: str):
+        try:
+            self.__client.head(f"https://{host}/", headers={"User-Agent": self.__user_agent})
 
-        if res.status_code >= 400:
-            res.raise_for_status()
+        except HTTPError:
+            pass
 
-        res_json: StreamableVideoData = res.json()
+    def __update_upload_metadata(self, shortcode: str, filename: str, video_sz: int,
+                                 title: str | None = None):
+        res = _json_request(self.__client, "PUT", self.VIDEO_URL.format(shortcode),
+                            {
+                                "original_name": filename,
+                                "original_size": video_sz,
+                                "title": title or Path(filename).stem,
+                                "upload_source": "web",
+                            },
+                            params={"purge": ""},
+                            headers={"User-Agent": self.__user_agent})
+
+        res_json: StreamableVideoData = _load_json(res)
 
         return res_json
 
@@ -484,81 +819,90 @@ class StreamableClient:
         return video_data
 
     def get_video_url(self, video_id: str):
-        res = self.__client.get(f"{StreamableClient.BASE_URL}/{video_id}",
-                                headers={"User-Agent": self.__user_agent})
-
-        if res.status_code >= 400:
-            res.raise_for_status()
+        res = self.__fetch_video_page(video_id)
 
-        vid_source_tag = BeautifulSoup(res.text, features="html.parser").find(
-            "meta",
-            attrs={"property": "og:video:secure_url"})
+        _raise_on_error(res)
 
-        assert isinstance(vid_source_tag, Tag)
-
-        video_source_url = vid_source_tag["content"]
-        assert isinstance(video_source_url, str)
+        video_source_url = search_string(
+            res.content, OG_VIDEO_RE, '//meta[@property="og:video:secure_url"]/@content')
+        assert video_source_url != ""
 
         return video_source_url
 
     def is_video_available(self, video_id: str):
-        return self.__client.get(f"{self.BASE_URL}/{video_id}",
-                                 headers={"User-Agent": self.__user_agent}).status_code < 400
+        return self.__client.head(self.VIDEO_PAGE_URL.format(video_id),
+                                  headers={"User-Agent": self.__user_agent}).status_code < 400
 
-    def is_video_processing(self, video_id: str):
-        res = self.__client.get(f"{StreamableClient.BASE_URL}/{video_id}",
-                                headers={"User-Agent": self.__user_agent})
+    def invalidate(self, video_id: str):
+        self.__page_cache.pop(video_id)
+
+    def get_video_status(self, video_id: str):
+        res = self.__fetch_video_page(video_id)
 
         if res.status_code >= 400:
-            res.raise_for_status()
+            return False, False
+
+        return True, self.PLAYER_MARKER not in res.content
+
+    def is_video_processing(self, video_id: str):
+        res = self.__fetch_video_page(video_id)
 
-        player_tag = BeautifulSoup(res.text, features="html.parser").find(
-            "div", attrs={"id": "player-content"})
+        _raise_on_error(res)
 
-        return player_tag is None
+        return self.PLAYER_MARKER not in res.content
+
+    def poll_processing(self, *video_ids: str):
+        with ThreadPoolExecutor(max_workers=min(len(video_ids), 8) or 1) as executor:
+            results = executor.map(self.is_video_processing, video_ids)
+
+        return dict(zip(video_ids, results))
 
     def upload_video(self, video_io: BinaryIO, filename: str = "video.mp4",
                      title: str | None = None, upload_region: str | None = None):
         upload_region = upload_region or "us-east-1"
 
-        video_io.seek(0, SEEK_END)
-        video_sz = video_io.tell()
-        video_io.seek(0, SEEK_SET)
+        try:
+            video_sz = fstat(video_io.fileno()).st_size
 
-        upload_data = self.__generate_upload_shortcode(video_sz)
-        self.__update_upload_metadata(upload_data["shortcode"], filename, video_sz, title=title)
+        except (AttributeError, OSError):
+            video_io.seek(0, SEEK_END)
+            video_sz = video_io.tell()
 
-        hash = sha256()
         video_io.seek(0, SEEK_SET)
 
-        while (len(chunk := video_io.read(4096)) > 0):
-            if len(chunk) > 4096:
-                raise IOError("Got more data than expected!")
-
-            hash.update(chunk)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            hash_future = executor.submit(file_digest, video_io, "sha256")
+            upload_data = self.__generate_upload_shortcode(video_sz)
+            upload_host = urlparse(upload_data["url"]).netloc
+            Thread(target=self.__warm_upload_connection, args=(upload_host,),
+                   daemon=True).start()
+            self.__update_upload_metadata(upload_data["shortcode"], filename, video_sz,
+                                          title=title)
+            video_hash = hash_future.result().hexdigest()
 
         video_io.seek(0, SEEK_SET)
-        video_hash = hash.hexdigest()
 
         req_datetime = datetime.now(tz=timezone.utc)
 
-        aws_headers = {}
-        aws_headers["Host"] = urlparse(upload_data["url"]).netloc
-        aws_headers["Content-Type"] = "application/octet-stream"
-        aws_headers["X-AMZ-ACL"] = "public-read"
-        aws_headers["X-AMZ-Content-SHA256"] = video_hash
-        aws_headers["X-AMZ-Security-Token"] = upload_data["credentials"]["sessionToken"]
-        aws_headers["X-AMZ-Date"] = req_datetime.strftime("%Y%m%dT%H%M%SZ")
-        aws_headers["Authorization"] = StreamableClient.__aws_authorization(
+        aws_headers = {
+            "Host": upload_host,
+            "Content-Type": "application/octet-stream",
+            "X-AMZ-ACL": "public-read",
+            "X-AMZ-Content-SHA256": video_hash,
+            "X-AMZ-Security-Token": upload_data["credentials"]["sessionToken"],
+            "X-AMZ-Date": req_datetime.strftime("%Y%m%dT%H%M%SZ"),
+        }
+        aws_headers["Authorization"] = _aws_authorization(
             "PUT", aws_headers, req_datetime, upload_data["credentials"]["accessKeyId"],
             upload_data["credentials"]["secretAccessKey"], "/" + upload_data["key"], {},
             upload_region, "s3")
+        aws_headers["Content-Length"] = str(video_sz)
 
-        res = self.__client.put(upload_data["transcoder_options"]["url"], data=video_io,
+        res = self.__client.put(upload_data["transcoder_options"]["url"],
+                                content=_PrefetchReader(video_io, video_sz),
                                 headers=aws_headers | {"User-Agent": self.__user_agent})
 
-        if res.status_code >= 400:
-            res.raise_for_status()
+        _raise_on_error(res)
 
         return self.__transcode_uploaded_video(upload_data["transcoder_options"]["shortcode"],
                                                upload_data["transcoder_options"]["url"],
@@ -566,13 +910,12 @@ class StreamableClient:
                                                upload_data["transcoder_options"]["size"])
 
     def video_extractor(self, url: str):
-        res = self.__client.get(f"{self.API_URL}/extract", params={"url": url},
+        res = self.__client.get(self.EXTRACT_URL, params={"url": url},
                                 headers={"User-Agent": self.__user_agent})
 
-        if res.status_code >= 400:
-            res.raise_for_status()
+        _raise_on_error(res)
 
-        res_json: StreamableVideoExtractorData = res.json()
+        res_json: StreamableVideoExtractorData = _load_json(res)
 
         assert "error" not in res_json or res_json["error"] is None, \
             "Error occurred while trying to extract video URL!\n" + \
@@ -583,98 +926,125 @@ class StreamableClient:
 
 class StreamffClient:
     BASE_URL = "https://streamff.com"
+    GENERATE_LINK_URL = BASE_URL + "/api/videos/generate-link"
+    UPLOAD_URL = BASE_URL + "/api/videos/upload/{}"
+    VIDEO_DATA_URL = BASE_URL + "/api/videos/{}"
+    VIDEO_PAGE_URL = BASE_URL + "/v/{}"
 
     def __init__(self, client: Client, user_agent: str | None = None):
         self.__client = client
         self.__user_agent = user_agent or __user_agent__
 
     def __generate_link(self):
-        return self.__client.post(f"{self.BASE_URL}/api/videos/generate-link",
+        return self.__client.post(self.GENERATE_LINK_URL,
                                   headers={"User-Agent": self.__user_agent})
 
     def get_video_data(self, video_id: str):
-        res = self.__client.get(f"{self.BASE_URL}/api/videos/{video_id}",
+        res = self.__client.get(self.VIDEO_DATA_URL.format(video_id),
                                 headers={"User-Agent": self.__user_agent})
 
-        if res.status_code >= 400:
-            res.raise_for_status()
+        _raise_on_error(res)
 
-        res_json: StreamffVideoData = res.json()
+        res_json: StreamffVideoData = _load_json(res)
         return res_json
 
     def upload_video(self, video_io: BinaryIO, filename: str = "video.mp4"):
         res = self.__generate_link()
 
-        if res.status_code >= 400:
-            res.raise_for_status()
+        _raise_on_error(res)
 
         video_id = res.text
 
-        video_mimetype = guess_type(filename, strict=False)[0]
+        video_mimetype = _guess_type(filename)
         assert video_mimetype is not None and video_mimetype.startswith("video/")
         files = {"file": (filename, video_io, video_mimetype)}
 
-        res = self.__client.post(f"{self.BASE_URL}/api/videos/upload/{video_id}", files=files,
-                                 headers={"User-Agent": self.__user_agent})
+        _multipart_upload(self.__client, self.UPLOAD_URL.format(video_id), files,
+                          headers={"User-Agent": self.__user_agent})
 
-        if res.status_code >= 400:
-            res.raise_for_status()
-
-        return video_id, f"https://streamff.com/v/{video_id}"
+        return video_id, self.VIDEO_PAGE_URL.format(video_id)
 
 
 class StreamjaClient:
     BASE_URL = "https://streamja.com"
+    PAGE_CACHE_SIZE = 128
+    PAGE_CACHE_TTL = 5.0
+    PLAYER_MARKER = b'id="video_container"'
+    SHORT_ID_URL = BASE_URL + "/shortId.php"
+    UPLOAD_URL = BASE_URL + "/upload.php"
+    VIDEO_PAGE_URL = BASE_URL + "/{}"
 
     def __init__(self, client: Client, user_agent: str | None = None):
         self.__client = client
+        self.__page_cache = _PageCache(self.PAGE_CACHE_SIZE, self.PAGE_CACHE_TTL)
         self.__user_agent = user_agent or __user_agent__
 
+    def __fetch_video_page(self, video_id: str):
+        res = self.__page_cache.get(video_id)
+
+        if res is not None:
+            return res
+
+        res = self.__client.get(StreamjaClient.VIDEO_PAGE_URL.format(video_id),
+                                headers={"User-Agent": self.__user_agent})
+
+        if res.status_code < 400:
+            self.__page_cache.put(video_id, res)
+
+        return res
+
     def __generate_upload_shortcode(self):
-        res = self.__client.post(f"{StreamjaClient.BASE_URL}/shortId.php", data={"new": 1},
+        res = self.__client.post(StreamjaClient.SHORT_ID_URL, data={"new": 1},
                                  headers={"User-Agent": self.__user_agent})
 
-        if res.status_code >= 400:
-            res.raise_for_status()
+        _raise_on_error(res)
 
-        res_json: StreamjaUploadUrlData = res.json()
+        res_json: StreamjaUploadUrlData = _load_json(res)
         return res_json
 
     def clear_cookies(self):
         self.__client.cookies.clear(domain="streamja.com")
 
     def get_video_url(self, video_id: str):
-        res = self.__client.get(f"{StreamjaClient.BASE_URL}/{video_id}",
-                                headers={"User-Agent": self.__user_agent})
+        res = self.__fetch_video_page(video_id)
 
-        if res.status_code >= 400:
-            res.raise_for_status()
+        _raise_on_error(res)
 
-        vid_source_tag = BeautifulSoup(res.text, features="html.parser").find("source")
-        assert isinstance(vid_source_tag, Tag)
-
-        vid_src_url = vid_source_tag["src"]
-        assert isinstance(vid_src_url, str)
+        vid_src_url = search_string(res.content, SOURCE_SRC_RE, "//source/@src")
+        assert vid_src_url != ""
 
         return vid_src_url
 
     def is_video_available(self, video_id: str):
-        return self.__client.get(f"{StreamjaClient.BASE_URL}/{video_id}",
-                                 headers={"User-Agent": self.__user_agent}).status_code < 400
+        return self.__client.head(StreamjaClient.VIDEO_PAGE_URL.format(video_id),
+                                  headers={"User-Agent": self.__user_agent}).status_code < 400
 
-    def is_video_processing(self, video_id: str):
-        res = self.__client.get(f"{StreamjaClient.BASE_URL}/{video_id}",
-                                headers={"User-Agent": self.__user_agent})
+    def invalidate(self, video_id: str):
+        self.__page_cache.pop(video_id)
+
+    def get_video_status(self, video_id: str):
+        res = self.__fetch_video_page(video_id)
 
         if res.status_code >= 400:
-            res.raise_for_status()
+            return False, False
+
+        return True, self.PLAYER_MARKER not in res.content
+
+    def is_video_processing(self, video_id: str):
+        res = self.__fetch_video_page(video_id)
+
+        _raise_on_error(res)
+
+        return self.PLAYER_MARKER not in res.content
+
+    def poll_processing(self, *video_ids: str):
+        with ThreadPoolExecutor(max_workers=min(len(video_ids), 8) or 1) as executor:
+            results = executor.map(self.is_video_processing, video_ids)
 
-        video_container = BeautifulSoup(res.text, features="html.parser").find(
-            "div", attrs={"id": "video_container"})
-        return video_container is None
+        return dict(zip(video_ids, results))
 
     def upload_video(self, video_io: BinaryIO, filename: str = "video.mp4"):
-        video_mimetype = guess_type(filename, strict=False)[0]
+        video_mimetype = _guess_type(filename)
         assert video_mimetype is not None and video_mimetype.startswith("video/")
         files = {"file": (filename, video_io, video_mimetype)}
         generate_shortcode_data = self.__generate_upload_shortcode()
@@ -688,14 +1058,11 @@ class StreamjaClient:
             assert "uploadUrl" in generate_shortcode_data
 
         short_id = generate_shortcode_data["shortId"]
-        res = self.__client.post(f"{StreamjaClient.BASE_URL}/upload.php", files=files,
-                                 params={"shortId": short_id},
-                                 headers={"User-Agent": self.__user_agent})
-
-        if res.status_code >= 400:
-            res.raise_for_status()
+        res = _multipart_upload(self.__client, StreamjaClient.UPLOAD_URL, files,
+                                params={"shortId": short_id},
+                                headers={"User-Agent": self.__user_agent})
 
-        res_json: StreamjaUploadData = res.json()
+        res_json: StreamjaUploadData = _load_json(res)
 
         if res_json["status"] == 0 or "error" in res_json:
             raise Exception("Error occurred while trying to upload video to Streamja video ID " +
@@ -710,18 +1077,15 @@ class StreamjaClient:
 
 
 class VHPClient:
+    LIMITS = Limits(max_connections=256, max_keepalive_connections=64)
     __CLIENT = None
 
-    def __init__(self, user_agent: str | None = None):
+    def __init__(self, user_agent: str | None = None, limits: Limits | None = None):
         if VHPClient.__CLIENT is None:
-            VHPClient.__CLIENT = Client(http2=h2_available)
+            VHPClient.__CLIENT = Client(transport=RetryTransport(http2=h2_available,
+                                                                 limits=limits or self.LIMITS))
             VHPClient.__CLIENT.follow_redirects = True
 
-        self.__gfycat = GfyCatClient(VHPClient.__CLIENT, user_agent=user_agent)
-        self.__imgur = ImgurClient(VHPClient.__CLIENT, user_agent=user_agent)
-        self.__streamable = StreamableClient(VHPClient.__CLIENT, user_agent=user_agent)
-        self.__streamff = StreamffClient(VHPClient.__CLIENT, user_agent=user_agent)
-        self.__streamja = StreamjaClient(VHPClient.__CLIENT, user_agent=user_agent)
         self.__user_agent = user_agent or __user_agent__
 
     def get_media_from_url(self, url: str):
@@ -729,22 +1093,28 @@ class VHPClient:
         res.raise_for_status()
         return BytesIO(res.read())
 
-    @property
+    def stream_media_from_url(self, url: str, chunk_size: int = 1 << 20):
+        with VHPClient.__CLIENT.stream("GET", url,
+                                       headers={"User-Agent": self.__user_agent}) as res:
+            res.raise_for_status()
+            yield from res.iter_bytes(chunk_size=chunk_size)
+
+    @cached_property
     def gfycat(self):
-        return self.__gfycat
+        return GfyCatClient(VHPClient.__CLIENT, user_agent=self.__user_agent)
 
-    @property
+    @cached_property
     def imgur(self):
-        return self.__imgur
+        return ImgurClient(VHPClient.__CLIENT, user_agent=self.__user_agent)
 
-    @property
+    @cached_property
     def streamable(self):
-        return self.__streamable
+        return StreamableClient(VHPClient.__CLIENT, user_agent=self.__user_agent)
 
-    @property
+    @cached_property
     def streamff(self):
-        return self.__streamff
+        return StreamffClient(VHPClient.__CLIENT, user_agent=self.__user_agent)
 
-    @property
+    @cached_property
     def streamja(self):
-        return self.__streamja
+        return StreamjaClient(VHPClient.__CLIENT, user_agent=self.__user_agent)
@@ -0,0 +1,40 @@
+# pyeXVHP - Python Interface for Video Hosting Platforms
+# Copyright © 2023 - eXhumer
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, version 3 of the License.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from html import unescape
+from re import compile as re_compile
+
+OG_VIDEO_RE = re_compile(rb'<meta[^>]*property="og:video:secure_url"[^>]*content="([^"]+)"')
+SOURCE_SRC_RE = re_compile(rb'<source[^>]*src="([^"]+)"')
+
+
+def document(markup: bytes):
+    from lxml import html
+    return html.fromstring(markup)
+
+
+def xpath_string(markup: bytes, path: str):
+    value = document(markup).xpath(f"string({path})")
+    assert isinstance(value, str)
+    return value
+
+
+def search_string(markup: bytes, pattern, path: str):
+    match = pattern.search(markup)
+
+    if match is not None:
+        return unescape(match.group(1).decode(encoding="utf8"))
+
+    return xpath_string(markup, path)
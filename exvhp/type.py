@@ -53,9 +53,6 @@ class GfyCatItem(TypedDict):
     views: int
     tags: list[str]
     userName: str
-    userName: str
-    userName: str
-    userName: str
     languageCategories: list[str] | None
     subreddit: str
     redditId: str